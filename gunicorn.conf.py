@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""Gunicorn configuration: the performance baseline for production runs.
+
+The Werkzeug dev server (``app.run(debug=True)``) is single-threaded with a
+Python-level request loop. This app is I/O-bound on PostgreSQL, so gevent
+workers let each process serve many requests concurrently while they wait on
+the database.
+
+Run from the project root:
+
+    gunicorn -c gunicorn.conf.py 'blog_app.run:app'
+"""
+
+wsgi_app = "blog_app.run:app"
+pythonpath = "src"
+
+worker_class = "gevent"
+workers = 4
+worker_connections = 200
+
+# Keep total DB demand in line with the pool configured in create_app
+# (pool_size=25 + max_overflow=25 per process).
+timeout = 30
+keepalive = 5
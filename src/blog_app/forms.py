@@ -1,30 +1,45 @@
 # -*- coding: utf-8 -*-
-"""Flask-WTF forms for authentication and Post creation."""
+"""Flask-WTF forms for authentication and Post creation.
+
+Field definitions below are class attributes, so WTForms builds each field's
+validator list exactly once at import time (UnboundField); per-request form
+instantiation only binds fields and never re-runs validator constructors.
+"""
 
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, SubmitField, TextAreaField, BooleanField
 from wtforms.validators import DataRequired, Email, Length
 
+# Imported eagerly so each worker pays email-validator's lazy import and
+# regex setup once at startup instead of on its first signup/login POST.
+import email_validator  # noqa: F401
+
+# WTForms validators are stateless after construction, so configurations used
+# by more than one field are shared as module-level singletons.
+_REQUIRED = DataRequired()
+_EMAIL = Email()
+_EMAIL_LENGTH = Length(max=255)
+
 
 class SignupForm(FlaskForm):
     """User registration form."""
-    name = StringField("Name", validators=[DataRequired(), Length(min=2, max=120)])
-    email = StringField("Email", validators=[DataRequired(), Email(), Length(max=255)])
-    password = PasswordField("Password", validators=[DataRequired(), Length(min=6, max=128)])
+    name = StringField("Name", validators=[_REQUIRED, Length(min=2, max=120)])
+    email = StringField("Email", validators=[_REQUIRED, _EMAIL, _EMAIL_LENGTH])
+    password = PasswordField("Password", validators=[_REQUIRED, Length(min=6, max=128)])
     submit = SubmitField("Create account")
 
 
 class LoginForm(FlaskForm):
     """User login form."""
-    email = StringField("Email", validators=[DataRequired(), Email(), Length(max=255)])
-    password = PasswordField("Password", validators=[DataRequired()])
+    email = StringField("Email", validators=[_REQUIRED, _EMAIL, _EMAIL_LENGTH])
+    password = PasswordField("Password", validators=[_REQUIRED])
     remember_me = BooleanField("Remember me")
     submit = SubmitField("Log in")
 
 
 class PostForm(FlaskForm):
     """Post creation form for the main entity."""
-    title = StringField("Title", validators=[DataRequired(), Length(min=3, max=200)])
-    category = StringField("Category", validators=[DataRequired(), Length(min=3, max=80)])
-    content = TextAreaField("Content", validators=[DataRequired(), Length(min=10)])
+    title = StringField("Title", validators=[_REQUIRED, Length(min=3, max=200)])
+    category = StringField("Category", validators=[_REQUIRED, Length(min=3, max=80)])
+    content = TextAreaField("Content", validators=[_REQUIRED, Length(min=10)])
     submit = SubmitField("Publish")
\ No newline at end of file
@@ -2,18 +2,29 @@
 """Database models for the Blog application."""
 
 from __future__ import annotations
+import hashlib
+import hmac
 from typing import Optional, List
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
-from sqlalchemy import Integer, String, Text, ForeignKey, func, select
+from sqlalchemy import (
+    Index, Integer, Row, String, Text, ForeignKey,
+    column, exists, func, literal, or_, select, values,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from slugify import slugify
 
 db = SQLAlchemy()
 
+# Pin the KDF and its cost so login latency stays deterministic (~tens of ms
+# per verification) instead of drifting with Werkzeug's library defaults.
+PASSWORD_HASH_METHOD = "scrypt:32768:8:1"
+
 
 class User(UserMixin, db.Model):
     """User model storing authentication and profile data."""
@@ -24,6 +35,12 @@ class User(UserMixin, db.Model):
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     password: Mapped[str] = mapped_column(String(255), nullable=False)
 
+    # Functional index so the case-insensitive lookup in get_by_email can use
+    # an index scan instead of a seq scan over lower(email).
+    __table_args__ = (
+        Index("ix_user_email_lower", func.lower(email), unique=True),
+    )
+
     # Relationship to posts; deletes cascade when user is deleted
     posts: Mapped[List["Post"]] = relationship(
         back_populates="author",
@@ -34,17 +51,82 @@ class User(UserMixin, db.Model):
     # ----- Required methods -----
     def set_password(self, password: str) -> None:
         """Hash and store password using Werkzeug."""
-        self.password = generate_password_hash(password)
+        self.password = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
 
     def check_password(self, password: str) -> bool:
-        """Verify password hash."""
-        return check_password_hash(self.password, password)
+        """Verify password hash.
+
+        Scrypt hashes are verified by calling ``hashlib.scrypt`` directly
+        with parameters parsed once and cached on the instance, then a
+        constant-time compare; per-check cost is the KDF itself. Other
+        (legacy) methods fall back to Werkzeug's parser.
+        """
+        parsed = getattr(self, "_parsed_password", None)
+        if parsed is None or parsed[0] != self.password:
+            parsed = (self.password, *self._decompose_hash(self.password))
+            self._parsed_password = parsed
+        _, scrypt_params, salt, digest = parsed
+        if scrypt_params is None:
+            return check_password_hash(self.password, password)
+        n, r, p = scrypt_params
+        computed = hashlib.scrypt(
+            password.encode("utf-8"),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=132 * n * r * p,  # matches Werkzeug's allowance
+        )
+        return hmac.compare_digest(computed.hex(), digest)
+
+    @staticmethod
+    def _decompose_hash(pwhash: str):
+        """Split ``scrypt:n:r:p$salt$hex`` into ((n, r, p), salt, digest).
+
+        Returns ``(None, None, None)`` for anything that is not a
+        well-formed scrypt hash, signalling the Werkzeug fallback.
+        """
+        try:
+            method, salt, digest = pwhash.split("$", 2)
+            if not method.startswith("scrypt:"):
+                return None, None, None
+            n, r, p = (int(x) for x in method.split(":")[1:])
+        except ValueError:
+            return None, None, None
+        return (n, r, p), salt.encode("utf-8"), digest
 
     def save(self) -> None:
         """Persist user to DB."""
         db.session.add(self)
         db.session.commit()
 
+    @classmethod
+    def create_if_absent(cls, name: str, email: str, password: str) -> Optional["User"]:
+        """Insert a new user unless the email is taken; return None on conflict.
+
+        Uses a single ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING``
+        so registration relies on the unique index instead of a separate
+        SELECT pre-check, closing the race window between check and insert.
+        """
+        # Emails are normalized to lowercase at write time so the unique
+        # indexes on email and lower(email) agree on what a duplicate is.
+        # ON CONFLICT targets the lower(email) index, which defines the
+        # app's uniqueness semantics: it also absorbs collisions with
+        # pre-existing mixed-case rows that the plain index would miss.
+        stmt = (
+            pg_insert(cls)
+            .values(
+                name=name,
+                email=email.lower(),
+                password=generate_password_hash(password, method=PASSWORD_HASH_METHOD),
+            )
+            .on_conflict_do_nothing(index_elements=[func.lower(cls.email)])
+            .returning(cls)
+        )
+        user = db.session.scalars(stmt).first()
+        db.session.commit()
+        return user
+
     @staticmethod
     def get_by_id(user_id: int) -> Optional["User"]:
         """Get user by ID."""
@@ -54,7 +136,7 @@ class User(UserMixin, db.Model):
     def get_by_email(email: str) -> Optional["User"]:
         """Get user by email (case-insensitive)."""
         stmt = select(User).where(func.lower(User.email) == func.lower(email))
-        return db.session.execute(stmt).scalar_one_or_none()
+        return db.session.scalars(stmt).first()
 
 
 class Post(db.Model):
@@ -75,22 +157,42 @@ class Post(db.Model):
 
     author: Mapped[User] = relationship(back_populates="posts")
 
+    # Composite index so per-author listings (WHERE user_id = ?
+    # ORDER BY id DESC LIMIT n) are a single index range scan with no sort.
+    __table_args__ = (
+        Index("ix_post_user_id_id_desc", "user_id", id.desc()),
+    )
+
     # ----- Required methods -----
     def _generate_unique_slug(self) -> str:
         """Generate a unique slug from the title; add numeric suffix when duplicated."""
         base = slugify(self.title) or "post"
-        candidate = base
-        counter = 1
-        # Optimistic check to ensure uniqueness before commit
-        while db.session.scalar(select(func.count()).select_from(Post).where(Post.slug == candidate)):
-            candidate = f"{base}-{counter}"
-            counter += 1
-        return candidate
+        # Fetch every colliding slug in one indexed range query instead of
+        # probing candidates one by one; the IntegrityError fallback in
+        # save() still covers concurrent inserts.
+        stmt = select(Post.slug).where(or_(Post.slug == base, Post.slug.like(f"{base}-%")))
+        existing = set(db.session.scalars(stmt).all())
+        if base not in existing:
+            return base
+        nums = {
+            int(s.rsplit("-", 1)[1])
+            for s in existing
+            if s.startswith(f"{base}-") and s.rsplit("-", 1)[1].isdigit()
+        }
+        return f"{base}-{max(nums, default=0) + 1}"
 
+    @hybrid_property
     def public_url(self) -> str:
-        """Return the public URL path for this post (used in templates)."""
+        """Public URL path for this post (used in templates and queries)."""
         return f"/post/{self.slug}/"
 
+    @public_url.expression
+    def public_url(cls):
+        return literal("/post/") + cls.slug + literal("/")
+
+    # How many numbered slug candidates each collision-resolving INSERT offers.
+    _SLUG_BATCH_SIZE = 32
+
     def save(self) -> None:
         """Persist post with automatic slug generation and collision handling."""
         if not getattr(self, "slug", None):
@@ -100,20 +202,51 @@ class Post(db.Model):
         try:
             db.session.commit()
         except IntegrityError:
-            # Handle rare race condition collisions: regenerate slug with numeric suffix
+            # Rare race with a concurrent insert on the same slug: resolve it
+            # with one batched atomic upsert instead of a commit/rollback
+            # cycle per candidate.
             db.session.rollback()
-            base = slugify(self.title) or "post"
-            counter = 1
-            while True:
-                new_slug = f"{base}-{counter}"
-                self.slug = new_slug
-                db.session.add(self)
-                try:
-                    db.session.commit()
-                    break
-                except IntegrityError:
-                    db.session.rollback()
-                    counter += 1
+            self._insert_resolving_collision()
+
+    def _insert_resolving_collision(self) -> None:
+        """Insert this post under the first free numbered slug candidate.
+
+        Each round trip hands PostgreSQL a batch of candidates via a single
+        ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``; the SELECT picks the
+        first candidate with no existing row, and DO NOTHING keeps the
+        statement safe against concurrent inserts, in which case the next
+        batch is tried.
+        """
+        base = slugify(self.title) or "post"
+        start = 1
+        while True:
+            cand = values(
+                column("slug", String), column("ord", Integer), name="cand"
+            ).data([(f"{base}-{i}", i) for i in range(start, start + self._SLUG_BATCH_SIZE)])
+            picked = (
+                select(
+                    literal(self.user_id).label("user_id"),
+                    literal(self.title).label("title"),
+                    literal(self.category).label("category"),
+                    literal(self.content).label("content"),
+                    cand.c.slug,
+                )
+                .where(~exists(select(Post.id).where(Post.slug == cand.c.slug)))
+                .order_by(cand.c.ord)
+                .limit(1)
+            )
+            stmt = (
+                pg_insert(Post)
+                .from_select(["user_id", "title", "category", "content", "slug"], picked)
+                .on_conflict_do_nothing(index_elements=["slug"])
+                .returning(Post.id, Post.slug)
+            )
+            row = db.session.execute(stmt).first()
+            db.session.commit()
+            if row is not None:
+                self.id, self.slug = row
+                return
+            start += self._SLUG_BATCH_SIZE
 
     def delete(self) -> None:
         """Deletes the object from the database."""
@@ -124,10 +257,35 @@ class Post(db.Model):
     def get_by_slug(slug: str) -> Optional["Post"]:
         """Get a single post by slug."""
         stmt = select(Post).where(Post.slug == slug)
-        return db.session.execute(stmt).scalar_one_or_none()
+        return db.session.scalars(stmt).first()
+
+    # The index template truncates content at 160 chars; fetching one extra
+    # character keeps its "..." overflow check working on the excerpt.
+    _EXCERPT_LENGTH = 161
 
     @staticmethod
-    def get_all() -> list["Post"]:
-        """Return all posts ordered by ID desc (newest first)."""
-        stmt = select(Post).order_by(Post.id.desc())
-        return list(db.session.execute(stmt).scalars().all())
\ No newline at end of file
+    def get_page(before_id: Optional[int] = None, limit: int = 20) -> List[Row]:
+        """Return one page of listing rows ordered by ID desc (newest first).
+
+        Selects only the columns the listing needs plus a short content
+        excerpt, instead of full entities, so the Text body is not shipped
+        from the database for every post. Pages are keyed on the indexed
+        ``id`` column (keyset pagination), which stays O(log N) at any page
+        depth, unlike OFFSET.
+        """
+        stmt = (
+            select(
+                Post.id,
+                Post.title,
+                Post.slug,
+                Post.category,
+                Post.user_id,
+                func.substr(Post.content, 1, Post._EXCERPT_LENGTH).label("content"),
+                Post.public_url.label("public_url"),
+            )
+            .order_by(Post.id.desc())
+            .limit(limit)
+        )
+        if before_id is not None:
+            stmt = stmt.where(Post.id < before_id)
+        return db.session.execute(stmt).all()
\ No newline at end of file